@@ -0,0 +1,73 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Protocol
+
+
+class Clock(Protocol):
+    """Интерфейс часов для EmailService"""
+
+    def now(self) -> datetime:
+        """Возвращает текущее время"""
+        ...
+
+
+class SystemClock:
+    """Системные часы: текущее время при каждом вызове"""
+
+    def now(self) -> datetime:
+        """Возвращает текущее время"""
+        return datetime.now()
+
+
+class MonotonicClock:
+    """
+    Дешевые часы на основе time.monotonic(), привязанные к эпохе при создании.
+    В пределах resolution секунд возвращают один и тот же объект datetime.
+    Потокобезопасны: один экземпляр можно разделять между потоками пула.
+    """
+
+    def __init__(self, resolution: float = 0.001):
+        self.resolution = resolution
+        self._epoch = time.time()
+        self._origin = time.monotonic()
+        self._tick: Optional[float] = None
+        self._cached: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        """Возвращает время текущего тика"""
+        elapsed = time.monotonic() - self._origin
+        with self._lock:
+            if self._tick is None or elapsed - self._tick >= self.resolution:
+                self._tick = elapsed
+                self._cached = datetime.fromtimestamp(self._epoch + elapsed)
+            return self._cached
+
+
+class FrozenClock:
+    """Замороженные часы: всегда возвращают одно и то же время"""
+
+    def __init__(self, moment: datetime):
+        self.moment = moment
+
+    def now(self) -> datetime:
+        """Возвращает зафиксированное время"""
+        return self.moment
+
+
+class SimulatedClock:
+    """
+    Симулированные часы: каждый вызов сдвигает время на step.
+    Не потокобезопасны, как и FrozenClock предназначены для тестов.
+    """
+
+    def __init__(self, start: datetime, step: timedelta = timedelta(seconds=1)):
+        self.current = start
+        self.step = step
+
+    def now(self) -> datetime:
+        """Возвращает текущее симулированное время и сдвигает его"""
+        moment = self.current
+        self.current = moment + self.step
+        return moment
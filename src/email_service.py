@@ -1,53 +1,223 @@
 import copy
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
+from src.clock import Clock, SystemClock
 from src.dataclass import Email
 from src.status import Status
 
 
+@dataclass
+class EmailJob:
+    """Задание на рассылку одного письма в пуле сервиса"""
+
+    email: Email
+    priority: int = 0
+    total: int = field(default=0, init=False)
+    # Результаты хранятся в порядке получателей; None - еще не обработан
+    results: List[Optional[Email]] = field(default_factory=list, init=False)
+    counts: Dict[Status, int] = field(default_factory=dict, init=False)
+    done: int = field(default=0, init=False)
+    started: bool = field(default=False, init=False)
+    # Подготовленная копия письма, снятая при добавлении задания
+    prepared: Optional[Email] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def _snapshot(self, prepared: Email) -> None:
+        """Фиксирует подготовленную копию письма и число получателей"""
+        self.prepared = prepared
+        self.total = len(prepared.recipients or [])
+        self.results = [None] * self.total
+
+    def __getstate__(self):
+        """Состояние для copy/pickle без блокировки"""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Восстанавливает состояние и создает новую блокировку"""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self) -> float:
+        """Доля обработанных получателей от 0.0 до 1.0"""
+        if self.total == 0:
+            return 1.0 if self.started else 0.0
+        return self.done / self.total
+
+    @property
+    def is_finished(self) -> bool:
+        """Проверяет, запущено ли задание и обработаны ли все получатели"""
+        return self.started and self.done >= self.total
+
+    def _record(self, index: int, sent: Email) -> None:
+        """Сохраняет результат отправки получателю с номером index"""
+        with self._lock:
+            self.results[index] = sent
+            self.done += 1
+            self.counts[sent.status] = self.counts.get(sent.status, 0) + 1
+
+
 class EmailService:
     """Сервис для отправки email сообщений"""
 
-    def __init__(self, email: Email):
+    def __init__(
+        self,
+        email: Optional[Email] = None,
+        max_workers: int = 4,
+        clock: Optional[Clock] = None,
+        batch_size: int = 100,
+    ):
         self.email = email
+        # Время берется один раз на пакет получателей, а не на каждого
+        self.clock: Clock = clock if clock is not None else SystemClock()
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.jobs: List[EmailJob] = []
+
+    @staticmethod
+    def _prepare(email: Email) -> Email:
+        """Создает подготовленную копию письма, не изменяя оригинал"""
+        email_copy = copy.deepcopy(email)
+
+        # Подготавливаем письмо если нужно
+        if email_copy.status != Status.READY:
+            email_copy.prepare()
+
+        return email_copy
+
+    @staticmethod
+    def _send_to_recipient(
+        email_copy: Email, recipient, sent_at: datetime
+    ) -> Email:
+        """Формирует письмо для одного получателя"""
+        # Создаем глубокую копию письма для каждого получателя
+        email_for_recipient = copy.deepcopy(email_copy)
+
+        # Оставляем только одного получателя
+        email_for_recipient.recipients = [recipient]
+
+        # Устанавливаем дату отправки
+        email_for_recipient.date = sent_at
+
+        # Меняем статус
+        if email_copy.status == Status.READY:
+            email_for_recipient.status = Status.SENT
+        else:
+            email_for_recipient.status = Status.FAILED
+
+        return email_for_recipient
 
     def send_email(self) -> List[Email]:
         """
         Имитирует отправку письма.
         Возвращает список писем (по одному на каждого получателя).
+        Все получатели получают одну отметку времени: часы читаются один раз.
 
         Returns:
             List[Email]: Список отправленных писем
         """
-        # Создаем копию для работы
-        email_copy = copy.deepcopy(self.email)
+        if self.email is None:
+            raise ValueError(
+                "Письмо не задано: используйте add_job() и run_jobs()"
+            )
 
-        # Подготавливаем письмо если нужно
-        if email_copy.status != Status.READY:
-            email_copy.prepare()
+        email_copy = self._prepare(self.email)
 
         # Исправление: если нет получателей, возвращаем пустой список
         if not email_copy.recipients or len(email_copy.recipients) == 0:
             return []
 
-        sent_emails = []
+        sent_at = self.clock.now()
+        return [
+            self._send_to_recipient(email_copy, recipient, sent_at)
+            for recipient in email_copy.recipients
+        ]
+
+    def add_job(self, email: Email, priority: int = 0) -> EmailJob:
+        """
+        Добавляет письмо в очередь рассылки.
+        Письмо копируется и подготавливается сразу, поэтому последующие
+        изменения оригинала не влияют на задание.
+        Приоритет задает долю пула: в каждом раунде задание получает
+        max(priority, 0) + 1 получателей, и задания с большим приоритетом
+        идут в раунде первыми.
+
+        Returns:
+            EmailJob: Задание для отслеживания прогресса
+        """
+        job = EmailJob(email=email, priority=priority)
+        job._snapshot(self._prepare(email))
+        self.jobs.append(job)
+        return job
+
+    def run_jobs(self) -> List[EmailJob]:
+        """
+        Выполняет все добавленные задания и блокирует до их завершения.
+        На каждый вызов создается пул потоков, общий для всех заданий вызова.
+        Получатели разных заданий чередуются по раундам (взвешенный
+        round-robin), поэтому одна большая рассылка не блокирует остальные.
+        Задачи отправляются в пул пакетами не больше batch_size получателей,
+        но так, чтобы пакетов было не меньше max_workers.
+        Часы читаются один раз на пакет в вызывающем потоке.
+        Прогресс заданий можно наблюдать из другого потока.
+        Исключение из любого потока пробрасывается после завершения пула.
+
+        Returns:
+            List[EmailJob]: Выполненные задания в порядке приоритета
+        """
+        # Забираем очередь одним присваиванием, чтобы не потерять add_job()
+        pending, self.jobs = self.jobs, []
+        # sorted стабилен: при равном приоритете сохраняется порядок добавления
+        jobs = sorted(pending, key=lambda job: -job.priority)
 
-        for recipient in email_copy.recipients:
-            # Создаем глубокую копию письма для каждого получателя
-            email_for_recipient = copy.deepcopy(email_copy)
+        queues = []
+        for job in jobs:
+            recipients = list(job.prepared.recipients or [])
+            queues.append((job, job.prepared, recipients))
+            job.started = True
 
-            # Оставляем только одного получателя
-            email_for_recipient.recipients = [recipient]
+        def task(batch, sent_at: datetime) -> None:
+            for job, email_copy, index, recipient in batch:
+                job._record(
+                    index,
+                    self._send_to_recipient(email_copy, recipient, sent_at),
+                )
 
-            # Устанавливаем дату отправки
-            email_for_recipient.date = datetime.now()
+        # Очередь пула FIFO, поэтому порядок пакетов задает чередование
+        order = []
+        cursors = [0] * len(queues)
+        while any(c < len(q[2]) for c, q in zip(cursors, queues)):
+            for n, (job, email_copy, recipients) in enumerate(queues):
+                start = cursors[n]
+                end = min(start + max(job.priority, 0) + 1, len(recipients))
+                for i in range(start, end):
+                    order.append((job, email_copy, i, recipients[i]))
+                cursors[n] = end
 
-            # Меняем статус
-            if email_copy.status == Status.READY:
-                email_for_recipient.status = Status.SENT
-            else:
-                email_for_recipient.status = Status.FAILED
+        # Не меньше max_workers пакетов, чтобы загрузить весь пул
+        size = max(
+            1, min(self.batch_size, math.ceil(len(order) / self.max_workers))
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for start in range(0, len(order), size):
+                # Одна отметка времени на пакет, в порядке отправки в пул
+                sent_at = self.clock.now()
+                futures.append(
+                    executor.submit(task, order[start:start + size], sent_at)
+                )
 
-            sent_emails.append(email_for_recipient)
+        for future in futures:
+            future.result()
 
-        return sent_emails
\ No newline at end of file
+        return jobs
@@ -1,8 +1,13 @@
+import copy
+import threading
+import time
 import pytest
+from datetime import datetime, timedelta
+from src.clock import FrozenClock, MonotonicClock, SimulatedClock
 from src.email_address import EmailAddress
 from src.dataclass import Email
 from src.status import Status
-from src.email_service import EmailService
+from src.email_service import EmailService, EmailJob
 
 
 def test_email_address_valid():
@@ -426,3 +431,261 @@ def test_status_transitions():
     assert sent.status == Status.SENT
 
 
+def test_run_jobs_sends_all_recipients_with_counts():
+    ready = Email(
+        "Hi",
+        "Msg",
+        EmailAddress("a@a.com"),
+        [EmailAddress(f"user{i}@mail.com") for i in range(5)],
+        status=Status.READY,
+    )
+    invalid = Email("", "", EmailAddress("a@a.com"), EmailAddress("b@b.com"))
+
+    service = EmailService(max_workers=2)
+    ready_job = service.add_job(ready)
+    invalid_job = service.add_job(invalid)
+    service.run_jobs()
+
+    assert isinstance(ready_job, EmailJob)
+    assert ready_job.is_finished
+    assert ready_job.progress == 1.0
+    assert ready_job.counts == {Status.SENT: 5}
+    assert invalid_job.counts == {Status.FAILED: 1}
+    assert service.jobs == []
+
+
+def test_run_jobs_orders_by_priority():
+    low = Email(
+        "Low", "Msg", EmailAddress("a@a.com"), ["b@b.com", "c@c.com"],
+        status=Status.READY,
+    )
+    high = Email(
+        "High", "Msg", EmailAddress("a@a.com"), ["d@d.com", "e@e.com"],
+        status=Status.READY,
+    )
+    order = []
+    service = EmailService(max_workers=1)
+    original = service._send_to_recipient
+
+    def tracking(email_copy, recipient, sent_at):
+        order.append(email_copy.subject)
+        return original(email_copy, recipient, sent_at)
+
+    service._send_to_recipient = tracking
+    service.add_job(low)
+    service.add_job(high, priority=10)
+    jobs = service.run_jobs()
+
+    assert [job.email.subject for job in jobs] == ["High", "Low"]
+    assert order == ["High", "High", "Low", "Low"]
+
+
+def test_job_not_finished_before_run():
+    email = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), ["b@b.com", "c@c.com"],
+        status=Status.READY,
+    )
+    empty = Email("Hi", "Msg", EmailAddress("a@a.com"), [], status=Status.READY)
+    service = EmailService()
+    job = service.add_job(email)
+    empty_job = service.add_job(empty)
+
+    assert job.total == 2
+    assert job.progress == 0.0
+    assert not job.is_finished
+    assert empty_job.progress == 0.0
+    assert not empty_job.is_finished
+    assert copy.deepcopy(job).total == 2
+
+
+def test_run_jobs_keeps_recipient_order():
+    recipients = [f"user{i}@mail.com" for i in range(200)]
+    email = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), recipients, status=Status.READY
+    )
+    service = EmailService(max_workers=8)
+    job = service.add_job(email)
+    service.run_jobs()
+
+    assert [msg.recipients[0].address for msg in job.results] == recipients
+
+
+def test_run_jobs_raises_worker_error():
+    email = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), ["b@b.com"], status=Status.READY
+    )
+    service = EmailService()
+
+    def broken(email_copy, recipient, sent_at):
+        raise RuntimeError("send failed")
+
+    service._send_to_recipient = broken
+    job = service.add_job(email)
+
+    with pytest.raises(RuntimeError):
+        service.run_jobs()
+    assert not job.is_finished
+
+
+def test_job_snapshots_recipients_on_add():
+    recipients = [EmailAddress("b@b.com"), EmailAddress("c@c.com")]
+    grown = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), list(recipients),
+        status=Status.READY,
+    )
+    shrunk = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), list(recipients),
+        status=Status.READY,
+    )
+    service = EmailService()
+    grown_job = service.add_job(grown)
+    shrunk_job = service.add_job(shrunk)
+    grown.recipients.append(EmailAddress("d@d.com"))
+    shrunk.recipients.pop()
+    service.run_jobs()
+
+    for job in (grown_job, shrunk_job):
+        assert job.is_finished
+        assert job.progress == 1.0
+        assert [msg.recipients[0].address for msg in job.results] == [
+            "b@b.com",
+            "c@c.com",
+        ]
+
+
+def test_job_output_fields_not_in_init():
+    email = Email("Hi", "Msg", EmailAddress("a@a.com"), ["b@b.com"])
+    with pytest.raises(TypeError):
+        EmailJob(email, total=5)
+
+
+def test_send_email_without_email_raises():
+    with pytest.raises(ValueError):
+        EmailService().send_email()
+
+
+def test_run_jobs_weights_share_by_priority():
+    low = Email(
+        "Low", "Msg", EmailAddress("a@a.com"),
+        [f"low{i}@mail.com" for i in range(4)], status=Status.READY,
+    )
+    high = Email(
+        "High", "Msg", EmailAddress("a@a.com"),
+        [f"high{i}@mail.com" for i in range(4)], status=Status.READY,
+    )
+    order = []
+    service = EmailService(max_workers=1)
+    original = service._send_to_recipient
+
+    def tracking(email_copy, recipient, sent_at):
+        order.append(email_copy.subject)
+        return original(email_copy, recipient, sent_at)
+
+    service._send_to_recipient = tracking
+    service.add_job(low)
+    service.add_job(high, priority=1)
+    service.run_jobs()
+
+    assert order == ["High", "High", "Low", "High", "High", "Low", "Low", "Low"]
+
+
+def test_run_jobs_without_recipients():
+    email = Email("Hi", "Msg", EmailAddress("a@a.com"), [], status=Status.READY)
+    service = EmailService()
+    job = service.add_job(email)
+    service.run_jobs()
+
+    assert job.total == 0
+    assert job.progress == 1.0
+    assert job.results == []
+
+
+def test_send_email_uses_injected_frozen_clock():
+    moment = datetime(2024, 1, 1, 12, 0)
+    email = Email(
+        "Hi",
+        "Msg",
+        EmailAddress("a@a.com"),
+        [EmailAddress("b@b.com"), EmailAddress("c@c.com")],
+        status=Status.READY,
+    )
+    service = EmailService(email, clock=FrozenClock(moment))
+    results = service.send_email()
+
+    assert all(msg.date == moment for msg in results)
+    assert email.date is None
+
+
+def test_simulated_clock_ticks_per_batch():
+    start = datetime(2024, 1, 1)
+    email = Email(
+        "Hi", "Msg", EmailAddress("a@a.com"), ["b@b.com", "c@c.com"],
+        status=Status.READY,
+    )
+    service = EmailService(
+        clock=SimulatedClock(start, timedelta(seconds=1)), batch_size=1
+    )
+    job = service.add_job(email)
+    service.run_jobs()
+
+    assert [msg.date for msg in job.results] == [
+        start,
+        start + timedelta(seconds=1),
+    ]
+
+
+def test_monotonic_clock_shares_timestamp_within_tick():
+    clock = MonotonicClock(resolution=60)
+    first = clock.now()
+    assert clock.now() is first
+    assert abs((first - datetime.now()).total_seconds()) < 1
+
+
+def test_run_jobs_reads_clock_once_per_batch():
+    class CountingClock:
+        def __init__(self):
+            self.calls = 0
+
+        def now(self) -> datetime:
+            self.calls += 1
+            return datetime(2024, 1, 1)
+
+    clock = CountingClock()
+    email = Email(
+        "Hi",
+        "Msg",
+        EmailAddress("a@a.com"),
+        [f"user{i}@mail.com" for i in range(250)],
+        status=Status.READY,
+    )
+    service = EmailService(max_workers=1, clock=clock, batch_size=100)
+    job = service.add_job(email)
+    service.run_jobs()
+
+    assert job.counts == {Status.SENT: 250}
+    assert clock.calls == 3
+
+
+def test_run_jobs_uses_several_workers():
+    email = Email(
+        "Hi",
+        "Msg",
+        EmailAddress("a@a.com"),
+        [f"user{i}@mail.com" for i in range(80)],
+        status=Status.READY,
+    )
+    threads = set()
+    service = EmailService(max_workers=4)
+    original = service._send_to_recipient
+
+    def tracking(email_copy, recipient, sent_at):
+        threads.add(threading.get_ident())
+        time.sleep(0.001)
+        return original(email_copy, recipient, sent_at)
+
+    service._send_to_recipient = tracking
+    job = service.add_job(email)
+    service.run_jobs()
+
+    assert job.counts == {Status.SENT: 80}
+    assert len(threads) > 1